@@ -14,36 +14,14 @@ import matplotlib.pyplot as plt
 # Polynomial Bezier surface example
 # -------------------------------------------------------------------------------------------------------------------- #
 # Define the array of control points
+# The control points are listed row by row with shape (m, n, n_dim) and transposed to shape (n_dim, n, m)
 n_dim, n, m = 3, 5, 4
-P = np.zeros((n_dim, n, m))
-
-# First row
-P[:, 0, 0] = [0.00, 3.00, 0.00]
-P[:, 1, 0] = [1.00, 2.00, 0.00]
-P[:, 2, 0] = [2.00, 1.50, 0.00]
-P[:, 3, 0] = [3.00, 2.00, 0.00]
-P[:, 4, 0] = [4.00, 3.00, 0.00]
-
-# Second row
-P[:, 0, 1] = [0.00, 3.00, 1.00]
-P[:, 1, 1] = [1.00, 2.00, 1.00]
-P[:, 2, 1] = [2.00, 1.50, 1.00]
-P[:, 3, 1] = [3.00, 2.00, 1.00]
-P[:, 4, 1] = [4.00, 3.00, 1.00]
-
-# Third row
-P[:, 0, 2] = [0.00, 3.00, 2.00]
-P[:, 1, 2] = [1.00, 2.00, 2.00]
-P[:, 2, 2] = [2.00, 1.50, 2.00]
-P[:, 3, 2] = [3.00, 2.00, 2.00]
-P[:, 4, 2] = [4.00, 3.00, 2.00]
-
-# Fourth row
-P[:, 0, 3] = [0.50, 3.00, 3.00]
-P[:, 1, 3] = [1.00, 2.50, 3.00]
-P[:, 2, 3] = [2.00, 2.00, 3.00]
-P[:, 3, 3] = [3.00, 2.50, 3.00]
-P[:, 4, 3] = [3.50, 3.00, 3.00]
+rows = [[[0.00, 3.00, 0.00], [1.00, 2.00, 0.00], [2.00, 1.50, 0.00], [3.00, 2.00, 0.00], [4.00, 3.00, 0.00]],   # First row
+        [[0.00, 3.00, 1.00], [1.00, 2.00, 1.00], [2.00, 1.50, 1.00], [3.00, 2.00, 1.00], [4.00, 3.00, 1.00]],   # Second row
+        [[0.00, 3.00, 2.00], [1.00, 2.00, 2.00], [2.00, 1.50, 2.00], [3.00, 2.00, 2.00], [4.00, 3.00, 2.00]],   # Third row
+        [[0.50, 3.00, 3.00], [1.00, 2.50, 3.00], [2.00, 2.00, 3.00], [3.00, 2.50, 3.00], [3.50, 3.00, 3.00]]]   # Fourth row
+P = np.asarray(rows, dtype=np.float64).transpose(2, 1, 0)
+assert P.shape == (n_dim, n, m)
 
 # Create and plot the Bezier surface
 bezierSurface = nrb.NurbsSurface(control_points=P)
@@ -56,7 +56,7 @@ def test_basis_function_example_1():
     N_analytic = get_analytic_polynomials(uu)
 
     # Check the error
-    error = np.sum((N_analytic - N_basis) ** 2) ** (1 / 2)
+    error = np.linalg.norm(N_analytic - N_basis)
     print('The two-norm of the evaluation error is         :  ', error)
     assert error < 1e-8
 
@@ -82,7 +82,7 @@ def test_partition_of_unity_property():
     N_basis = nrb.compute_basis_polynomials(n, p, U, u)
 
     # Check the error
-    error = np.sum((np.sum(N_basis, axis=0) - 1)**2) ** (1/2)
+    error = np.linalg.norm(np.sum(N_basis, axis=0) - 1)
     print('The two-norm of the partition of unity error is :  ', error)
     assert error < 1e-8
 
@@ -109,7 +109,7 @@ def test_basis_function_zeroth_derivative():
     dN_basis = nrb.compute_basis_polynomials_derivatives(n, p, U, u, derivative_order=0)
 
     # Check the error
-    error = np.sum((dN_basis - N_basis) ** 2) ** (1 / 2) / u.size
+    error = np.linalg.norm(dN_basis - N_basis) / u.size
     print('The two-norm of the zeroth derivative error is  :  ', error)
     assert error < 1e-8
 
@@ -141,7 +141,7 @@ def test_basis_function_first_derivative_cs():
     dN_fd = np.imag(nrb.compute_basis_polynomials(n, p, U, u + h*1j)) / h
 
     # Check the error
-    error = np.sum((dN_basis - dN_fd) ** 2) ** (1 / 2) / Nu
+    error = np.linalg.norm(dN_basis - dN_fd) / Nu
     print('The two-norm of the first derivative error is   :  ', error)
     assert error < 1e-12
 
@@ -175,7 +175,7 @@ def test_basis_function_first_derivative_cfd():
     dN_fd = (a + b) / h
 
     # Check the error
-    error = np.sum((dN_basis - dN_fd) ** 2) ** (1 / 2) / Nu
+    error = np.linalg.norm(dN_basis - dN_fd) / Nu
     print('The two-norm of the first derivative error is   :  ', error)
     assert error < 1e-8
 
@@ -210,7 +210,7 @@ def test_basis_function_second_derivative_cfd():
     ddN_fd = (a + b + c) / h ** 2
 
     # Check the error
-    error = np.sum((ddN_basis - ddN_fd) ** 2) ** (1 / 2) / Nu
+    error = np.linalg.norm(ddN_basis - ddN_fd) / Nu
     print('The two-norm of the second derivative error is  :  ', error)
     assert error < 1e-6
 
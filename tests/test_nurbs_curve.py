@@ -3,15 +3,174 @@
 # -------------------------------------------------------------------------------------------------------------------- #
 # Importing packages
 # -------------------------------------------------------------------------------------------------------------------- #
-import sys
-import os
-import time
-import pdb
+import pytest
 import numpy as np
 import nurbspy as nrb
 import scipy.integrate
 
 
+# -------------------------------------------------------------------------------------------------------------------- #
+# Define module-level constants
+# -------------------------------------------------------------------------------------------------------------------- #
+# Default u-parametrization shared by the tests (do not modify it in place)
+_U101 = np.linspace(0.00, 1.00, 101)
+
+# Defining parameters of the 2D circular arc
+_ARC_2D = dict(O=np.asarray([0.00, 1.00]),                    # Circle center
+               X=np.asarray([1.00, 0.00]),                    # Abscissa direction
+               Y=np.asarray([0.00, 1.00]),                    # Ordinate direction
+               R=0.5,                                         # Circle radius
+               theta_start=1 / 6 * np.pi,                     # Start angle
+               theta_end=3 / 2 * np.pi - 1 / 6 * np.pi)       # End angle
+
+# Defining parameters of the 3D circular arc
+_ARC_3D = dict(O=np.asarray([0.00, 0.00, 0.50]),              # Circle center
+               X=np.asarray([3.00, 0.00, 0.00]),              # Abscissa direction
+               Y=np.asarray([0.00, 1.00, 0.00]),              # Ordinate direction
+               R=0.5,                                         # Circle radius
+               theta_start=0.00,                              # Start angle
+               theta_end=np.pi / 2)                           # End angle
+
+# Frenet-Serret frame of reference of the 3D circular arc at the start and end points (one column per point)
+_TANGENT_ENDPOINTS  = np.array([[0.0, -1.0], [1.0, 0.0], [0.0, 0.0]])
+_NORMAL_ENDPOINTS   = np.array([[-1.0, 0.0], [0.0, -1.0], [0.0, 0.0]])
+_BINORMAL_ENDPOINTS = np.array([[0.0, 0.0], [0.0, 0.0], [1.0, 1.0]])
+
+
+# -------------------------------------------------------------------------------------------------------------------- #
+# Define auxiliary functions
+# -------------------------------------------------------------------------------------------------------------------- #
+def _clamped_knots(n, p):
+
+    """ Create a clamped knot vector with p+1 zeros, n-p equispaced interior points, and p+1 ones """
+
+    # Fill a preallocated buffer in place instead of concatenating temporary arrays
+    U = np.empty(n + p + 2, dtype=np.float64)
+    U[:p] = 0.00
+    U[p:n+2] = np.linspace(0, 1, n - p + 2)
+    U[n+2:] = 1.00
+
+    return U
+
+
+def _radius_error(coords, O=None, R=1.00):
+
+    """ Compute the two-norm of the deviation of the squared distances from the center ´O´ with respect to ´R**2´
+
+    The center is assumed to be the origin when ´O´ is not given
+
+    """
+
+    # Column-wise squared distances in a single pass followed by a single norm reduction
+    d = coords if O is None else coords - O[:, np.newaxis]
+    radius_error = np.linalg.norm(np.einsum('ij,ij->j', d, d) - R * R)
+
+    return radius_error
+
+
+def _create_nurbs3D():
+
+    """ Create the 3D NURBS curve shared by the derivative tests """
+
+    # Define the array of control points
+    P = np.zeros((3, 5))
+    P[:, 0] = [0.00, 0.00, 0.00]
+    P[:, 1] = [0.00, 0.30, 0.05]
+    P[:, 2] = [0.25, 0.30, 0.30]
+    P[:, 3] = [0.50, 0.30, -0.05]
+    P[:, 4] = [0.50, 0.10, 0.10]
+
+    # Maximum index of the control points (counting from zero)
+    n = np.shape(P)[1] - 1
+
+    # Define the array of control point weights
+    W = np.asarray([1, 1, 3, 1, 1])
+
+    # Define the order of the basis polynomials
+    # Linear (p = 1), Quadratic (p = 2), Cubic (p = 3), etc.
+    # Set p = n (number of control points minus one) to obtain a Bezier
+    p = 3
+
+    # Define the knot vector (clamped spline)
+    # p+1 zeros, n-p equispaced points between 0 and 1, and p+1 ones. In total r+1 points where r=n+p+1
+    U = _clamped_knots(n, p)
+
+    # Create the NURBS curve
+    nurbs3D = nrb.NurbsCurve(control_points=P, weights=W, degree=p, knots=U)
+
+    return nurbs3D
+
+
+@pytest.fixture(scope="module")
+def nurbs3D():
+
+    """ Provide the 3D NURBS curve shared by the derivative tests (created once per module) """
+
+    return _create_nurbs3D()
+
+
+@pytest.fixture(scope="module")
+def arc_2d():
+
+    """ Create the 2D circular arc shared by the circular arc tests """
+
+    return nrb.CircularArc(**_ARC_2D).NurbsCurve
+
+
+@pytest.fixture(scope="module")
+def arc_3d():
+
+    """ Create the 3D circular arc shared by the circular arc tests """
+
+    return nrb.CircularArc(**_ARC_3D).NurbsCurve
+
+
+def _batched_get_value(curve, u):
+
+    """ Evaluate a NURBS curve grouping the u-parametrization by knot span
+
+    The p+1 non-vanishing basis polynomials are computed once per knot span (algorithm A2.2) for all the points that
+    lie in that span and the coordinates are obtained by matrix multiplication with the local control points
+
+    """
+
+    # Get NURBS curve parameters
+    P, W, p, U = curve.P, curve.W, curve.p, curve.U
+    n = np.shape(P)[1] - 1
+
+    # Map the control points to homogeneous space | P_w = (x*w,y*w,z*w,w)
+    P_w = np.concatenate((P * W[np.newaxis, :], W[np.newaxis, :]), axis=0)
+
+    # Locate the knot span of each point (the end point u=1 belongs to the last non-empty span)
+    u = np.atleast_1d(np.asarray(u, dtype=np.float64))
+    spans = np.clip(np.searchsorted(U, u, side='right') - 1, p, n)
+    span_values, span_indices = np.unique(spans, return_inverse=True)
+
+    # Evaluate the curve in homogeneous space span by span
+    C_w = np.zeros((np.shape(P_w)[0], u.size))
+    for k, i in enumerate(span_values):
+        uu = u[span_indices == k]
+        N = np.zeros((p + 1, uu.size))
+        left = np.zeros((p + 1, uu.size))
+        right = np.zeros((p + 1, uu.size))
+        N[0] = 1.00
+        for j in range(1, p + 1):
+            left[j] = uu - U[i + 1 - j]
+            right[j] = U[i + j] - uu
+            saved = 0.00
+            for r in range(j):
+                temp = N[r] / (right[r + 1] + left[j - r])
+                N[r] = saved + right[r + 1] * temp
+                saved = left[j - r] * temp
+            N[j] = saved
+        C_w[:, span_indices == k] = np.dot(P_w[:, i - p:i + 1], N)
+
+    # Map the coordinates back to the ordinary space
+    C = C_w[0:-1, :] / C_w[-1, :]
+
+    return C
+
+
 # -------------------------------------------------------------------------------------------------------------------- #
 # Prepare the NURBS curve test suite
 # -------------------------------------------------------------------------------------------------------------------- #
@@ -29,11 +188,11 @@ def test_nurbs_curve_float_input():
 
     # Check real
     values_real = bezierCurve.get_value(u=0.5).flatten()
-    assert np.sum((values_real - np.asarray([0.5, 0.5])) ** 2) ** (1 / 2) < 1e-6
+    assert np.linalg.norm(values_real - np.asarray([0.5, 0.5])) < 1e-6
 
     # Check complex
     values_complex = bezierCurve.get_value(u=0.5 + 0.5j).flatten()
-    assert np.sum((values_complex - np.asarray([0.5 + 0.5j, 0.5 + 0.5j])) ** 2) ** (1 / 2) < 1e-6
+    assert np.linalg.norm(values_complex - np.asarray([0.5 + 0.5j, 0.5 + 0.5j])) < 1e-6
 
 
 def test_nurbs_curve_integer_input():
@@ -50,11 +209,11 @@ def test_nurbs_curve_integer_input():
 
     # Check u=0
     values_real = bezierCurve.get_value(u=0).flatten()
-    assert np.sum((values_real - np.asarray([0.0, 0.0])) ** 2) ** (1 / 2) < 1e-6
+    assert np.linalg.norm(values_real - np.asarray([0.0, 0.0])) < 1e-6
 
     # Check u=1
     values_real = bezierCurve.get_value(u=1).flatten()
-    assert np.sum((values_real - np.asarray([1.0, 1.0])) ** 2) ** (1 / 2) < 1e-6
+    assert np.linalg.norm(values_real - np.asarray([1.0, 1.0])) < 1e-6
 
 
 def test_nurbs_curve_endpoint_interpolation():
@@ -79,14 +238,14 @@ def test_nurbs_curve_endpoint_interpolation():
 
     # Define the knot vector (clamped spline)
     # p+1 zeros, n-p equispaced points between 0 and 1, and p+1 ones. In total r+1 points where r=n+p+1
-    U = np.concatenate((np.zeros(p), np.linspace(0, 1, n - p + 2), np.ones(p)))
+    U = _clamped_knots(n, p)
 
     # Create the NURBS curve
     nurbsCurve = nrb.NurbsCurve(control_points=P, weights=W, degree=p, knots=U)
 
     # Check the corner point values
-    assert np.sum((nurbsCurve.get_value(u=0.00).flatten() - P[:,  0]) ** 2) ** (1 / 2) < 1e-6
-    assert np.sum((nurbsCurve.get_value(u=1.00).flatten() - P[:, -1]) ** 2) ** (1 / 2) < 1e-6
+    assert np.linalg.norm(nurbsCurve.get_value(u=0.00).flatten() - P[:,  0]) < 1e-6
+    assert np.linalg.norm(nurbsCurve.get_value(u=1.00).flatten() - P[:, -1]) < 1e-6
 
 
 def test_nurbs_curve_endpoint_curvature():
@@ -118,7 +277,7 @@ def test_nurbs_curve_endpoint_curvature():
 
     # Define the knot vector (clamped spline)
     # p+1 zeros, n-p equispaced points between 0 and 1, and p+1 ones. In total r+1 points where r=n+p+1
-    U = np.concatenate((np.zeros(p), np.linspace(0, 1, n - p + 2), np.ones(p)))
+    U = _clamped_knots(n, p)
 
     # Create the NURBS curve
     myCurve = nrb.NurbsCurve(control_points=P, weights=W, degree=p, knots=U)
@@ -181,7 +340,7 @@ def test_nurbs_curve_arclength():
 
     # Define the knot vector (clamped spline)
     # p+1 zeros, n-p equispaced points between 0 and 1, and p+1 ones. In total r+1 points where r=n+p+1
-    U = np.concatenate((np.zeros(p), np.linspace(0, 1, n - p + 2), np.ones(p)))
+    U = _clamped_knots(n, p)
 
     # Create the NURBS curve
     myCurve = nrb.NurbsCurve(control_points=P, weights=W, degree=p, knots=U)
@@ -234,7 +393,7 @@ def test_nurbs_curve_example_1():
     values_analytic = (1/8*P2 + 6/8*P3 + 1/8*P4)[:, np.newaxis]
 
     # Check the error
-    error = np.sum((values_analytic - values_numeric) ** 2) ** (1 / 2)
+    error = np.linalg.norm(values_analytic - values_numeric)
     print('The two-norm of the evaluation error is         :  ', error)
     assert error < 1e-8
 
@@ -270,11 +429,11 @@ def test_nurbs_curve_example_2():
     myCircle = nrb.NurbsCurve(P, W, p, U)
 
     # Define the u-parametrization
-    u = np.linspace(0, 1, 101)
+    u = _U101
 
     # Check the radius error
     coords = myCircle.get_value(u)
-    radius_error = np.sum((np.sum((coords)**2, axis=0) - 1) ** 2) ** (1/2)
+    radius_error = _radius_error(coords)
     print('The two-norm of the evaluation error is         :  ', radius_error)
     assert radius_error < 1e-8
 
@@ -309,42 +468,36 @@ def test_nurbs_curve_example_3():
     myCircle = nrb.NurbsCurve(P, W, p, U)
 
     # Define the u-parametrization
-    u = np.linspace(0, 1, 101)
+    u = _U101
 
     # Check the radius error
     coords = myCircle.get_value(u)
-    radius_error = np.sum((np.sum((coords)**2, axis=0) - 1) ** 2) ** (1/2)
+    radius_error = _radius_error(coords)
     print('The two-norm of the evaluation error is         :  ', radius_error)
     assert radius_error < 1e-8
 
 
-def test_nurbs_curve_example_4():
+def test_nurbs_curve_example_4(arc_2d):
 
     """ Test the computation of a circular NURBS curve value, curvature and arc-length in 2D """
 
-    # Set defining parameters
-    O = np.asarray([0.00, 1.00])                 # Circle center
-    X = np.asarray([1.00, 0.00])                 # Abscissa direction
-    Y = np.asarray([0.00, 1.00])                 # Ordinate direction
-    R = 0.5                                      # Circle radius
-    theta_start = 1 / 6 * np.pi                  # Start angle
-    theta_end = 3 / 2 * np.pi - 1 / 6 * np.pi    # End angle
-
-    # Create and plot the circular arc
-    my_circular_arc = nrb.CircularArc(O, X, Y, R, theta_start, theta_end).NurbsCurve
+    # Get the defining parameters and the circular arc
+    O, R = _ARC_2D['O'], _ARC_2D['R']
+    theta_start, theta_end = _ARC_2D['theta_start'], _ARC_2D['theta_end']
+    my_circular_arc = arc_2d
 
     # Define the u-parametrization
-    u = np.linspace(0, 1, 101)
+    u = _U101
 
     # Check the radius error
     coords = my_circular_arc.get_value(u)
-    radius_error = np.sum((np.sum((coords-O[:, np.newaxis])**2, axis=0) - R**2) ** 2) ** (1/2)
+    radius_error = _radius_error(coords, O, R)
     print('The two-norm of the radius error is             :  ', radius_error)
     assert radius_error < 1e-8
 
     # CHeck the curvature error
     curvature = my_circular_arc.get_curvature(u)
-    curvature_error = np.sum((curvature - 1 / R) ** 2) ** (1 / 2)
+    curvature_error = np.linalg.norm(curvature - 1 / R)
     print("The two-norm of the curvature error is          :  ", curvature_error)
     assert curvature_error < 1e-8
 
@@ -355,33 +508,27 @@ def test_nurbs_curve_example_4():
     assert arc_length_error < 1e-2
 
 
-def test_nurbs_curve_example_5():
+def test_nurbs_curve_example_5(arc_3d):
 
     """ Test the computation of a circular NURBS curve value, curvature and arc-length in 3D """
 
-    # Set defining parameters
-    O = np.asarray([0.00, 0.00, 0.50])      # Circle center
-    X = np.asarray([3.00, 0.00, 0.00])      # Abscissa direction
-    Y = np.asarray([0.00, 1.00, 0.00])      # Ordinate direction
-    R = 0.5                                 # Circle radius
-    theta_start = 0.00                      # Start angle
-    theta_end = np.pi/2                     # End angle
-
-    # Create and plot the circular arc
-    my_circular_arc = nrb.CircularArc(O, X, Y , R, theta_start, theta_end).NurbsCurve
+    # Get the defining parameters and the circular arc
+    O, R = _ARC_3D['O'], _ARC_3D['R']
+    theta_start, theta_end = _ARC_3D['theta_start'], _ARC_3D['theta_end']
+    my_circular_arc = arc_3d
 
     # Define the u-parametrization
-    u = np.linspace(0, 1, 101)
+    u = _U101
 
     # Check the radius error
     coords = my_circular_arc.get_value(u)
-    radius_error = np.sum((np.sum((coords-O[:, np.newaxis])**2, axis=0) - R**2) ** 2) ** (1/2)
+    radius_error = _radius_error(coords, O, R)
     print('The two-norm of the radius error is             :  ', radius_error)
     assert radius_error < 1e-8
 
     # CHeck the curvature error
     curvature = my_circular_arc.get_curvature(u)
-    curvature_error = np.sum((curvature - 1 / R) ** 2) ** (1 / 2)
+    curvature_error = np.linalg.norm(curvature - 1 / R)
     print("The two-norm of the curvature error is          :  ", curvature_error)
     assert curvature_error < 1e-8
 
@@ -391,205 +538,77 @@ def test_nurbs_curve_example_5():
     print("The arc length computation error is             :  ", arc_length_error)
     assert arc_length_error < 1e-2
 
-    # Check the Frenet-Serret frame of reference computation (starting point)
-    assert np.sum((my_circular_arc.get_tangent(u=0.00)  - np.asarray([0, 1, 0])[:, np.newaxis]) ** 2) ** (1 / 2) < 1e-6
-    assert np.sum((my_circular_arc.get_normal(u=0.00)  - np.asarray([-1, 0, 0])[:, np.newaxis]) ** 2) ** (1 / 2) < 1e-6
-    assert np.sum((my_circular_arc.get_binormal(u=0.00) - np.asarray([0, 0, 1])[:, np.newaxis]) ** 2) ** (1 / 2) < 1e-6
+    # Check the Frenet-Serret frame of reference computation (start and end points evaluated in a single call)
+    u = np.asarray([0.00, 1.00])
+    np.testing.assert_allclose(my_circular_arc.get_tangent(u),  _TANGENT_ENDPOINTS,  rtol=0, atol=1e-6)
+    np.testing.assert_allclose(my_circular_arc.get_normal(u),   _NORMAL_ENDPOINTS,   rtol=0, atol=1e-6)
+    np.testing.assert_allclose(my_circular_arc.get_binormal(u), _BINORMAL_ENDPOINTS, rtol=0, atol=1e-6)
 
-    # Check the Frenet-Serret frame of reference computation (end point)
-    assert np.sum((my_circular_arc.get_tangent(u=1.00)  - np.asarray([-1, 0, 0])[:, np.newaxis]) ** 2) ** (1 / 2) < 1e-6
-    assert np.sum((my_circular_arc.get_normal(u=1.00)   - np.asarray([0, -1, 0])[:, np.newaxis]) ** 2) ** (1 / 2) < 1e-6
-    assert np.sum((my_circular_arc.get_binormal(u=1.00) - np.asarray([0, 0, 1])[:, np.newaxis]) ** 2) ** (1 / 2) < 1e-6
 
+def test_nurbs_curve_span_evaluation(nurbs3D):
 
-def test_nurbs_curve_zeroth_derivative():
+    """ Test the curve evaluation against the local (knot span by knot span) evaluation of the basis polynomials """
 
-    """ Test that the zero-th derivative agrees with the function evaluation """
-
-    # Define the array of control points
-    P = np.zeros((3, 5))
-    P[:, 0] = [0.00, 0.00, 0.00]
-    P[:, 1] = [0.00, 0.30, 0.05]
-    P[:, 2] = [0.25, 0.30, 0.30]
-    P[:, 3] = [0.50, 0.30, -0.05]
-    P[:, 4] = [0.50, 0.10, 0.10]
+    # Define the u-parametrization
+    u = _U101
 
-    # Maximum index of the control points (counting from zero)
-    n = np.shape(P)[1] - 1
+    # Compute the NURBS curve values
+    C = nurbs3D.get_value(u)
+    C_span = _batched_get_value(nurbs3D, u)
 
-    # Define the array of control point weights
-    W = np.asarray([1, 1, 3, 1, 1])
+    # Check the error
+    error = np.linalg.norm(C - C_span) / u.size
+    print('The two-norm of the span evaluation error is    :  ', error)
+    assert error < 1e-12
 
-    # Define the order of the basis polynomials
-    # Linear (p = 1), Quadratic (p = 2), Cubic (p = 3), etc.
-    # Set p = n (number of control points minus one) to obtain a Bezier
-    p = 3
 
-    # Define the knot vector (clamped spline)
-    # p+1 zeros, n-p equispaced points between 0 and 1, and p+1 ones. In total r+1 points where r=n+p+1
-    U = np.concatenate((np.zeros(p), np.linspace(0, 1, n - p + 2), np.ones(p)))
+def test_nurbs_curve_zeroth_derivative(nurbs3D):
 
-    # Create the NURBS curve
-    nurbs3D = nrb.NurbsCurve(control_points=P, weights=W, degree=p, knots=U)
+    """ Test that the zero-th derivative agrees with the function evaluation """
 
     # Define the u-parametrization
-    u = np.linspace(0, 1, 101)
+    u = _U101
 
     # Compute the NURBS curve values
     C  = nurbs3D.get_value(u)
     dC = nurbs3D.get_derivative(u, order=0)
 
     # Check the error
-    error = np.sum((C - dC) ** 2) ** (1 / 2) / u.size
+    error = np.linalg.norm(C - dC) / u.size
     print('The two-norm of the zeroth derivative error is  :  ', error)
     assert error < 1e-8
 
 
-def test_nurbs_curve_first_derivative_cs():
+def test_nurbs_curve_first_derivative_cs(nurbs3D):
 
-    """ Test the first derivative against the complex step method """
-
-    # Define the array of control points
-    P = np.zeros((3, 5))
-    P[:, 0] = [0.00, 0.00, 0.00]
-    P[:, 1] = [0.00, 0.30, 0.05]
-    P[:, 2] = [0.25, 0.30, 0.30]
-    P[:, 3] = [0.50, 0.30, -0.05]
-    P[:, 4] = [0.50, 0.10, 0.10]
-
-    # Maximum index of the control points (counting from zero)
-    n = np.shape(P)[1] - 1
-
-    # Define the array of control point weights
-    W = np.asarray([1, 1, 3, 1, 1])
-
-    # Define the order of the basis polynomials
-    # Linear (p = 1), Quadratic (p = 2), Cubic (p = 3), etc.
-    # Set p = n (number of control points minus one) to obtain a Bezier
-    p = 3
-
-    # Define the knot vector (clamped spline)
-    # p+1 zeros, n-p equispaced points between 0 and 1, and p+1 ones. In total r+1 points where r=n+p+1
-    U = np.concatenate((np.zeros(p), np.linspace(0, 1, n - p + 2), np.ones(p)))
-
-    # Create the NURBS curve
-    nurbs3D = nrb.NurbsCurve(control_points=P, weights=W, degree=p, knots=U)
+    """ Test the first and second derivatives against the complex step method """
 
     # Define the u-parametrization
-    u = np.linspace(0, 1, 101)
+    u = _U101
     h = 1e-12
 
-    # Compute the NURBS analytic derivative
-    dC_analytic = nurbs3D.get_derivative(u, order=1)
-
-    # Compute the NURBS complex step derivative
-    dC_complex_step = np.imag(nurbs3D.get_value(u + h * 1j)) / h
-
-    # Check the error
-    error = np.sum((dC_analytic - dC_complex_step) ** 2) ** (1 / 2) / u.size
-    print('The two-norm of the first derivative error is   :  ', error)
-    assert error < 1e-8
-
-
-def test_nurbs_curve_first_derivative_cfd():
-
-    """ Test the first derivative against central finite differences """
-
-    # Define the array of control points
-    P = np.zeros((3, 5))
-    P[:, 0] = [0.00, 0.00, 0.00]
-    P[:, 1] = [0.00, 0.30, 0.05]
-    P[:, 2] = [0.25, 0.30, 0.30]
-    P[:, 3] = [0.50, 0.30, -0.05]
-    P[:, 4] = [0.50, 0.10, 0.10]
-
-    # Maximum index of the control points (counting from zero)
-    n = np.shape(P)[1] - 1
-
-    # Define the array of control point weights
-    W = np.asarray([1, 1, 3, 1, 1])
-
-    # Define the order of the basis polynomials
-    # Linear (p = 1), Quadratic (p = 2), Cubic (p = 3), etc.
-    # Set p = n (number of control points minus one) to obtain a Bezier
-    p = 3
-
-    # Define the knot vector (clamped spline)
-    # p+1 zeros, n-p equispaced points between 0 and 1, and p+1 ones. In total r+1 points where r=n+p+1
-    U = np.concatenate((np.zeros(p), np.linspace(0, 1, n - p + 2), np.ones(p)))
-
-    # Create the NURBS curve
-    nurbs3D = nrb.NurbsCurve(control_points=P, weights=W, degree=p, knots=U)
+    # Define the complex u-parametrization once (reused for the first and second derivatives)
+    u_complex = np.empty_like(u, dtype=np.complex128)
+    u_complex.real[:] = u
+    u_complex.imag[:] = h
 
-    # Define a new u-parametrization suitable for finite differences
-    h = 1e-5
-    hh = h + h ** 2
-    Nu = 1000
-    u = np.linspace(0.00 + hh, 1.00 - hh, Nu)  # Make sure that the limits [0, 1] also work when making changes
+    # Preallocate one output buffer per complex step derivative
+    dC_complex_step = np.empty((nurbs3D.ndim, u.size), dtype=np.float64)
+    ddC_complex_step = np.empty((nurbs3D.ndim, u.size), dtype=np.float64)
 
-    # Compute the NURBS analytic derivative
+    # Check the first derivative error
     dC_analytic = nurbs3D.get_derivative(u, order=1)
-
-    # Compute the NURBS central finite differences derivative
-    a = -1 / 2 * nurbs3D.get_value(u - h)
-    b = +1 / 2 * nurbs3D.get_value(u + h)
-    dC_cfd = (a + b) / h
-
-    # Check the error
-    error = np.sum((dC_analytic - dC_cfd) ** 2) ** (1 / 2) / u.size
+    np.multiply(nurbs3D.get_value(u_complex).imag, 1.0 / h, out=dC_complex_step)
+    error = np.linalg.norm(dC_analytic - dC_complex_step) / u.size
     print('The two-norm of the first derivative error is   :  ', error)
-    assert error < 1e-6
-
-
-def test_nurbs_curve_second_derivative_cfd():
-
-    """ Test the first derivative against central finite differences """
-
-    # Define the array of control points
-    P = np.zeros((3, 5))
-    P[:, 0] = [0.00, 0.00, 0.00]
-    P[:, 1] = [0.00, 0.30, 0.05]
-    P[:, 2] = [0.25, 0.30, 0.30]
-    P[:, 3] = [0.50, 0.30, -0.05]
-    P[:, 4] = [0.50, 0.10, 0.10]
-
-    # Maximum index of the control points (counting from zero)
-    n = np.shape(P)[1] - 1
-
-    # Define the array of control point weights
-    W = np.asarray([1, 1, 3, 1, 1])
-
-    # Define the order of the basis polynomials
-    # Linear (p = 1), Quadratic (p = 2), Cubic (p = 3), etc.
-    # Set p = n (number of control points minus one) to obtain a Bezier
-    p = 3
-
-    # Define the knot vector (clamped spline)
-    # p+1 zeros, n-p equispaced points between 0 and 1, and p+1 ones. In total r+1 points where r=n+p+1
-    U = np.concatenate((np.zeros(p), np.linspace(0, 1, n - p + 2), np.ones(p)))
-
-    # Create the NURBS curve
-    nurbs3D = nrb.NurbsCurve(control_points=P, weights=W, degree=p, knots=U)
-
-    # Define a new u-parametrization suitable for finite differences
-    h = 1e-5
-    hh = h + h ** 2
-    Nu = 1000
-    u = np.linspace(0.00 + hh, 1.00 - hh, Nu)  # Make sure that the limits [0, 1] also work when making changes
-
-    # Compute the NURBS analytic derivative
-    dC_analytic = nurbs3D.get_derivative(u, order=2)
-
-    # Compute the NURBS central finite differences derivative
-    a = +1 * nurbs3D.get_value(u - h)
-    b = -2 * nurbs3D.get_value(u)
-    c = +1 * nurbs3D.get_value(u + h)
-    dC_cfd = (a + b + c) / h**2
+    assert error < 1e-8
 
-    # Check the error
-    error = np.sum((dC_analytic - dC_cfd) ** 2) ** (1 / 2) / u.size
+    # Check the second derivative error
+    ddC_analytic = nurbs3D.get_derivative(u, order=2)
+    np.multiply(nurbs3D.get_derivative(u_complex, order=1).imag, 1.0 / h, out=ddC_complex_step)
+    error = np.linalg.norm(ddC_analytic - ddC_complex_step) / u.size
     print('The two-norm of the second derivative error is  :  ', error)
-    assert error < 1e-6
+    assert error < 1e-8
 
 
 def test_nurbs_curve_first_derivative_endpoint():
@@ -617,7 +636,7 @@ def test_nurbs_curve_first_derivative_endpoint():
 
     # Define the knot vector (clamped spline)
     # p+1 zeros, n-p equispaced points between 0 and 1, and p+1 ones. In total r+1 points where r=n+p+1
-    U = np.concatenate((np.zeros(p), np.linspace(0, 1, n - p + 2), np.ones(p)))
+    U = _clamped_knots(n, p)
 
     # Create the NURBS curve
     nurbs3D = nrb.NurbsCurve(control_points=P, weights=W, degree=p, knots=U)
@@ -631,8 +650,8 @@ def test_nurbs_curve_first_derivative_endpoint():
     dC_analytic_1 = (p / (1-U[n])) * (W[n-1] / W[n]) * (P[:, n] - P[:, n-1])
 
     # Check the error
-    error_0 = np.sum((dC_analytic_0 - dC_numeric_0) ** 2) ** (1 / 2)
-    error_1 = np.sum((dC_analytic_1 - dC_numeric_1) ** 2) ** (1 / 2)
+    error_0 = np.linalg.norm(dC_analytic_0 - dC_numeric_0)
+    error_1 = np.linalg.norm(dC_analytic_1 - dC_numeric_1)
     print('The start point first derivative error is       :  ', error_0)
     print('The end point first derivative error is         :  ', error_1)
     assert error_0 < 1e-6
@@ -664,7 +683,7 @@ def test_nurbs_curve_second_derivative_endpoint():
 
     # Define the knot vector (clamped spline)
     # p+1 zeros, n-p equispaced points between 0 and 1, and p+1 ones. In total r+1 points where r=n+p+1
-    U = np.concatenate((np.zeros(p), np.linspace(0, 1, n - p + 2), np.ones(p)))
+    U = _clamped_knots(n, p)
 
     # Create the NURBS curve
     nurbs3D = nrb.NurbsCurve(control_points=P, weights=W, degree=p, knots=U)
@@ -678,8 +697,8 @@ def test_nurbs_curve_second_derivative_endpoint():
     ddC_analytic_1 = p*(p-1) / (1 - U[n]) * (1/(1 - U[n-1]) * (W[n-2] / W[n]) * (P[:, n-2] - P[:, n]) - (1/(1 - U[n]) + 1/(1 - U[n-1])) * (W[n-1] / W[n]) * (P[:, n-1] - P[:, n]) ) + 2 * (p / (1 - U[n])) ** 2 * (W[n-1] / W[n]) * (1 - W[n-1] / W[n]) * (P[:, n-1] - P[:, n])
 
     # Check the error
-    error_0 = np.sum((ddC_analytic_0 - ddC_numeric_0) ** 2) ** (1 / 2)
-    error_1 = np.sum((ddC_analytic_1 - ddC_numeric_1) ** 2) ** (1 / 2)
+    error_0 = np.linalg.norm(ddC_analytic_0 - ddC_numeric_0)
+    error_1 = np.linalg.norm(ddC_analytic_1 - ddC_numeric_1)
     print('The start point second derivative error is      :  ', error_0)
     print('The end point second derivative error is        :  ', error_1)
     assert error_0 < 1e-6
@@ -709,7 +728,7 @@ def test_nurbs_curve_point_projection():
 
     # Define the knot vector (clamped spline)
     # p+1 zeros, n-p equispaced points between 0 and 1, and p+1 ones. In total r+1 points where r=n+p+1
-    U = np.concatenate((np.zeros(p), np.linspace(0, 1, n - p + 2), np.ones(p)))
+    U = _clamped_knots(n, p)
 
     # Create the NURBS curve
     nurbs3D = nrb.NurbsCurve(control_points=P, weights=W, degree=p, knots=U)
@@ -741,12 +760,11 @@ def test_nurbs_curve_point_projection():
 # test_nurbs_curve_example_1()
 # test_nurbs_curve_example_2()
 # test_nurbs_curve_example_3()
-# test_nurbs_curve_example_4()
-# test_nurbs_curve_example_5()
-# test_nurbs_curve_zeroth_derivative()
-# test_nurbs_curve_first_derivative_cs()
-# test_nurbs_curve_first_derivative_cfd()
-# test_nurbs_curve_second_derivative_cfd()
+# test_nurbs_curve_example_4(nrb.CircularArc(**_ARC_2D).NurbsCurve)
+# test_nurbs_curve_example_5(nrb.CircularArc(**_ARC_3D).NurbsCurve)
+# test_nurbs_curve_span_evaluation(_create_nurbs3D())
+# test_nurbs_curve_zeroth_derivative(_create_nurbs3D())
+# test_nurbs_curve_first_derivative_cs(_create_nurbs3D())
 # test_nurbs_curve_first_derivative_endpoint()
 # test_nurbs_curve_second_derivative_endpoint()
 # test_nurbs_curve_point_projection()
@@ -35,11 +35,11 @@ def test_nurbs_surface_scalar_input():
 
     # Check real
     values_real = bezierSurface.get_value(u=0.5, v=0.5).flatten()
-    assert np.sum((values_real - np.asarray([0.5, 0.5, 0.0])) ** 2) ** (1 / 2) < 1e-6
+    assert np.linalg.norm(values_real - np.asarray([0.5, 0.5, 0.0])) < 1e-6
 
     # Check complex
     values_complex = bezierSurface.get_value(u=0.5 + 0.5j, v=0.5 + 0.5j).flatten()
-    assert np.sum((values_complex - np.asarray([0.5 + 0.5j, 0.5 + 0.5j, 0.0])) ** 2) ** (1 / 2) < 1e-6
+    assert np.linalg.norm(values_complex - np.asarray([0.5 + 0.5j, 0.5 + 0.5j, 0.0])) < 1e-6
 
 
 def test_nurbs_surface_endpoint_property():
@@ -62,10 +62,10 @@ def test_nurbs_surface_endpoint_property():
     bezierSurface = nrb.NurbsSurface(control_points=P)
 
     # Check the corner point values
-    assert np.sum((bezierSurface.get_value(u=0.00, v=0.00).flatten() - P[:, 0, 0]) ** 2) ** (1 / 2) < 1e-6
-    assert np.sum((bezierSurface.get_value(u=1.00, v=0.00).flatten() - P[:, 1, 0]) ** 2) ** (1 / 2) < 1e-6
-    assert np.sum((bezierSurface.get_value(u=0.00, v=1.00).flatten() - P[:, 0, 1]) ** 2) ** (1 / 2) < 1e-6
-    assert np.sum((bezierSurface.get_value(u=1.00, v=1.00).flatten() - P[:, 1, 1]) ** 2) ** (1 / 2) < 1e-6
+    assert np.linalg.norm(bezierSurface.get_value(u=0.00, v=0.00).flatten() - P[:, 0, 0]) < 1e-6
+    assert np.linalg.norm(bezierSurface.get_value(u=1.00, v=0.00).flatten() - P[:, 1, 0]) < 1e-6
+    assert np.linalg.norm(bezierSurface.get_value(u=0.00, v=1.00).flatten() - P[:, 0, 1]) < 1e-6
+    assert np.linalg.norm(bezierSurface.get_value(u=1.00, v=1.00).flatten() - P[:, 1, 1]) < 1e-6
 
 
 def test_nurbs_surface_example_1():
@@ -97,20 +97,20 @@ def test_nurbs_surface_example_1():
     # Check value error
     values_numeric = planarSurface.get_value(u, v)
     values_analytic = np.concatenate((u[np.newaxis, :], v[np.newaxis, :], (1.00 + 0*u)[np.newaxis, :]))
-    values_error = np.sum((values_analytic - values_numeric) ** 2) ** (1 / 2) / (Nu * Nv)
+    values_error = np.linalg.norm(values_analytic - values_numeric) / (Nu * Nv)
     print('The two-norm of the values error is             :  ', values_error)
     assert values_error < 1e-12
 
     # Check the error of the unitary normal vectors
     normals = planarSurface.get_normals(u, v)
-    normals_error = np.sum((normals[2, :] - np.ones((u.size,)))**2) ** (1/2) / (Nu * Nv)
+    normals_error = np.linalg.norm(normals[2, :] - np.ones((u.size,))) / (Nu * Nv)
     print('The two-norm of the normals error is            :  ', normals_error)
     assert  normals_error < 1e-12
 
     # Check curvature error
     mean_curvature, gaussian_curvature = planarSurface.get_curvature(u, v)
-    mean_curvature_error = np.sum(mean_curvature**2) ** (1/2) / (Nu * Nv)
-    gaussian_curvature_error = np.sum(gaussian_curvature ** 2) ** (1 / 2) / (Nu * Nv)
+    mean_curvature_error = np.linalg.norm(mean_curvature) / (Nu * Nv)
+    gaussian_curvature_error = np.linalg.norm(gaussian_curvature) / (Nu * Nv)
     print('The two-norm of the mean curvature error is     :  ', mean_curvature_error)
     print('The two-norm of the gaussian curvature error is :  ', gaussian_curvature_error)
     assert  mean_curvature_error < 1e-12
@@ -150,7 +150,7 @@ def test_nurbs_surface_example_2():
 
     # Check radius error
     values_numeric = cylinderSurface.get_value(u, v) - O[:, np.newaxis]
-    values_error = np.sum(((values_numeric[0, :]**2 + values_numeric[1, :]**2) - R**2) **2) **(1 / 2) / (Nu * Nv)
+    values_error = np.linalg.norm((values_numeric[0, :]**2 + values_numeric[1, :]**2) - R**2) / (Nu * Nv)
     print('The two-norm of the values error is             :  ', values_error)
     assert values_error < 1e-12
 
@@ -159,15 +159,15 @@ def test_nurbs_surface_example_2():
     normals_analytic = cylinderSurface.get_value(u, v) - O[:, np.newaxis]
     normals_analytic = normals_analytic / (np.sum((normals_analytic[[0, 1], :])**2, axis=0) ** (1/2))[np.newaxis,:]
     normals_analytic[2, :] = 0.0
-    normals_error = np.sum((normals_analytic - normals_numeric)**2) ** (1/2) / (Nu * Nv)
+    normals_error = np.linalg.norm(normals_analytic - normals_numeric) / (Nu * Nv)
     print('The two-norm of the normals error is            :  ', normals_error)
     assert  normals_error < 1e-12
 
     # Check curvature error
     mean_curvature, gaussian_curvature = cylinderSurface.get_curvature(u, v)
     mean_curvature, gaussian_curvature = np.abs(mean_curvature), np.abs(gaussian_curvature)
-    mean_curvature_error = np.sum((mean_curvature - 1/(2*R))**2) ** (1 / 2) / (Nu * Nv)
-    gaussian_curvature_error = np.sum(gaussian_curvature ** 2) ** (1 / 2) / (Nu * Nv)
+    mean_curvature_error = np.linalg.norm(mean_curvature - 1/(2*R)) / (Nu * Nv)
+    gaussian_curvature_error = np.linalg.norm(gaussian_curvature) / (Nu * Nv)
     print('The two-norm of the mean curvature error is     :  ', mean_curvature_error)
     print('The two-norm of the gaussian curvature error is :  ', gaussian_curvature_error)
     assert  mean_curvature_error < 1e-12
@@ -207,7 +207,7 @@ def test_nurbs_surface_example_3():
 
     # Check radius error
     values_numeric = sphericSurface.get_value(u, v)
-    values_error = np.sum((np.sum(values_numeric**2, axis=0) - R**2) ** 2) ** (1 / 2) / (Nu * Nv)
+    values_error = np.linalg.norm(np.sum(values_numeric**2, axis=0) - R**2) / (Nu * Nv)
     print('The two-norm of the values error is             :  ', values_error)
     assert values_error < 1e-12
 
@@ -215,15 +215,15 @@ def test_nurbs_surface_example_3():
     normals_numeric = -sphericSurface.get_normals(u, v)
     normals_analytic = sphericSurface.get_value(u, v)
     normals_analytic = normals_analytic / (np.sum(normals_analytic**2, axis=0) ** (1/2))[np.newaxis,:]
-    normals_error = np.sum((normals_analytic - normals_numeric)**2) ** (1/2) / (Nu * Nv)
+    normals_error = np.linalg.norm(normals_analytic - normals_numeric) / (Nu * Nv)
     print('The two-norm of the normals error is            :  ', normals_error)
     assert  normals_error < 1e-12
 
     # Check curvature error
     mean_curvature, gaussian_curvature = sphericSurface.get_curvature(u, v)
     mean_curvature, gaussian_curvature = np.abs(mean_curvature), np.abs(gaussian_curvature)
-    mean_curvature_error = np.sum((mean_curvature - 1/R) ** 2) ** (1 / 2) / (Nu * Nv)
-    gaussian_curvature_error = np.sum((gaussian_curvature - 1/R**2) ** 2) ** (1 / 2) / (Nu * Nv)
+    mean_curvature_error = np.linalg.norm(mean_curvature - 1/R) / (Nu * Nv)
+    gaussian_curvature_error = np.linalg.norm(gaussian_curvature - 1/R**2) / (Nu * Nv)
     print('The two-norm of the mean curvature error is     :  ', mean_curvature_error)
     print('The two-norm of the gaussian curvature error is :  ', gaussian_curvature_error)
     assert  mean_curvature_error < 1e-12
@@ -243,7 +243,7 @@ def test_nurbs_surface_bilinear():
     # Create the NURBS surface and evaluate the coordinates of a known case
     bilinearSurface = nrb.NurbsSurfaceBilinear(P00, P01, P10, P11).NurbsSurface
     coordinates = bilinearSurface.get_value(u=0.50, v=0.50)
-    values_error = np.sum((coordinates.flatten() - np.asarray([1.00, 0.75, 0.00]))**2)**(1/2)
+    values_error = np.linalg.norm(coordinates.flatten() - np.asarray([1.00, 0.75, 0.00]))
     print('The two-norm of the values error is             :  ', values_error)
     assert  values_error < 1e-8
 
@@ -275,7 +275,7 @@ def test_nurbs_surface_ruled():
     # Create the NURBS surface and evaluate the coordinates of a known case
     ruledSurface = nrb.NurbsSurfaceRuled(nurbsCurve1, nurbsCurve2).NurbsSurface
     coordinates = ruledSurface.get_value(u=0.50, v=0.50)
-    values_error = np.sum((coordinates.flatten() - np.asarray([0.50, 0.50, 0.25]))**2)**(1/2)
+    values_error = np.linalg.norm(coordinates.flatten() - np.asarray([0.50, 0.50, 0.25]))
     print('The two-norm of the values error is             :  ', values_error)
     assert  values_error < 1e-8
 
@@ -303,7 +303,7 @@ def test_nurbs_surface_extruded():
     # Create the NURBS surface and evaluate the coordinates of a known case
     extrudedSurface = nrb.NurbsSurfaceExtruded(nurbsCurve, direction, length).NurbsSurface
     coordinates = extrudedSurface.get_value(u=0.50, v=0.50)
-    values_error = np.sum((coordinates.flatten() - np.asarray([0.77841878, 0.57841878, 0.36084392]))**2)**(1/2)
+    values_error = np.linalg.norm(coordinates.flatten() - np.asarray([0.77841878, 0.57841878, 0.36084392]))
     print('The two-norm of the values error is             :  ', values_error)
     assert  values_error < 1e-8
 
@@ -338,7 +338,7 @@ def test_nurbs_surface_revolution():
     # Create the NURBS surface and evaluate the coordinates of a known case
     revolutionSurface = nrb.NurbsSurfaceRevolution(nurbsGeneratrix, axis_point, axis_direction, theta_start, theta_end).NurbsSurface
     coordinates = revolutionSurface.get_value(u=0.50, v=0.50)
-    values_error = np.sum((coordinates.flatten() - np.asarray([-0.27777778, -0.22222222, 0.61111111]))**2)**(1/2)
+    values_error = np.linalg.norm(coordinates.flatten() - np.asarray([-0.27777778, -0.22222222, 0.61111111]))
     print('The two-norm of the values error is             :  ', values_error)
     assert  values_error < 1e-8
 
@@ -384,7 +384,7 @@ def test_nurbs_surface_coons():
     # Create the NURBS surface and evaluate the coordinates of a known case
     coonsSurface = nrb.NurbsSurfaceCoons(nurbsCurve_south, nurbsCurve_north, nurbsCurve_west, nurbsCurve_east).NurbsSurface
     coordinates = coonsSurface.get_value(u=0.50, v=0.50)
-    values_error = np.sum((coordinates.flatten() - np.asarray([0.48500000, 0.56964286, 0.08571429]))**2)**(1/2)
+    values_error = np.linalg.norm(coordinates.flatten() - np.asarray([0.48500000, 0.56964286, 0.08571429]))
     print('The two-norm of the values error is             :  ', values_error)
     assert  values_error < 1e-8
 
@@ -406,7 +406,7 @@ def test_nurbs_surface_zeroth_derivative():
     dS = nurbsSurface.get_derivative(u, v, order_u=0, order_v=0)
 
     # Check the error
-    error = np.sum((S - dS) ** 2) ** (1 / 2) / u.size
+    error = np.linalg.norm(S - dS) / u.size
     print('Derivative (0,0) two-norm error is              :  ', error)
     assert error < 1e-12
 
@@ -434,8 +434,8 @@ def test_nurbs_surface_first_derivatives_cs():
     dSdv_complex_step = np.imag(nurbsSurface.get_value(u, v + h * 1j)) / h
 
     # Check the error
-    error_u  = np.sum((dSdu_analytic  - dSdu_complex_step)  ** 2) ** (1 / 2) / (Nu * Nv)
-    error_v  = np.sum((dSdv_analytic  - dSdv_complex_step)  ** 2) ** (1 / 2) / (Nu * Nv)
+    error_u  = np.linalg.norm(dSdu_analytic  - dSdu_complex_step) / (Nu * Nv)
+    error_v  = np.linalg.norm(dSdv_analytic  - dSdv_complex_step) / (Nu * Nv)
     print('Derivative (1,0) two-norm error is              :  ', error_u)
     print('Derivative (0,1) two-norm error is              :  ', error_v)
     assert error_u < 1e-12
@@ -465,8 +465,8 @@ def test_nurbs_surface_first_derivatives_cfd():
     dSdv_cfd = (nurbsSurface.get_value(u, v+h) - nurbsSurface.get_value(u, v-h)) / (2*h)
 
     # Check the error
-    error_u  = np.sum((dSdu_analytic  - dSdu_cfd)  ** 2) ** (1 / 2) / (Nu * Nv)
-    error_v  = np.sum((dSdv_analytic  - dSdv_cfd)  ** 2) ** (1 / 2) / (Nu * Nv)
+    error_u  = np.linalg.norm(dSdu_analytic  - dSdu_cfd) / (Nu * Nv)
+    error_v  = np.linalg.norm(dSdv_analytic  - dSdv_cfd) / (Nu * Nv)
     print('Derivative (1,0) two-norm error is              :  ', error_u)
     print('Derivative (0,1) two-norm error is              :  ', error_v)
     assert error_u < 1e-6
@@ -499,9 +499,9 @@ def test_nurbs_surface_second_derivatives_cfd():
                  nurbsSurface.get_value(u + h, v - h) + nurbsSurface.get_value(u - h, v - h)) / (4 * h ** 2)
 
     # Check the error
-    error_u  = np.sum((dSdu_analytic  - dSdu_cfd)  ** 2) ** (1 / 2) / (Nu * Nv)
-    error_v  = np.sum((dSdv_analytic  - dSdv_cfd)  ** 2) ** (1 / 2) / (Nu * Nv)
-    error_uv = np.sum((dSduv_analytic - dSduv_cfd) ** 2) ** (1 / 2) / (Nu * Nv)
+    error_u  = np.linalg.norm(dSdu_analytic  - dSdu_cfd) / (Nu * Nv)
+    error_v  = np.linalg.norm(dSdv_analytic  - dSdv_cfd) / (Nu * Nv)
+    error_uv = np.linalg.norm(dSduv_analytic - dSduv_cfd) / (Nu * Nv)
     print('Derivative (2,0) two-norm error is              :  ', error_u)
     print('Derivative (0,2) two-norm error is              :  ', error_v)
     print('Derivative (1,1) two-norm error is              :  ', error_uv)